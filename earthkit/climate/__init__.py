@@ -20,6 +20,18 @@ except ImportError:  # pragma: no cover
     # Local copy or not installed with setuptools
     __version__ = "999"
 
-from earthkit import aggregate
+__all__ = ["aggregate", "__version__"]
 
-__all__ = [aggregate, __version__]
+
+def __getattr__(name):
+    # earthkit.aggregate pulls in xarray, pandas and earthkit.data, so only import it on first access
+    if name == "aggregate":
+        from earthkit import aggregate
+
+        globals()["aggregate"] = aggregate
+        return aggregate
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | {"aggregate"})
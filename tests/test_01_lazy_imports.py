@@ -0,0 +1,13 @@
+import subprocess
+import sys
+
+from earthkit import climate
+
+
+def test_aggregate_not_imported_eagerly() -> None:
+    code = "import sys, earthkit.climate; assert 'earthkit.aggregate' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_dir_lists_aggregate() -> None:
+    assert "aggregate" in dir(climate)